@@ -19,6 +19,14 @@ def sql_database() -> str:
     return os.environ['SQL_DATABASE']
 
 
+def sql_pool_size() -> int:
+    return int(os.environ.get('SQL_POOL_SIZE', 25))
+
+
+def sql_max_overflow() -> int:
+    return int(os.environ.get('SQL_MAX_OVERFLOW', 25))
+
+
 def sqlite_database() -> str:
     return os.environ['SQLITE_DATABASE']
 
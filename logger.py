@@ -1,6 +1,10 @@
 import toolbox.config as config
 
 
+def enabled() -> bool:
+    return bool(config.debug())
+
+
 def debug(msg: str, *args, **kwargs):
-    if config.debug():
+    if enabled():
         print(msg)
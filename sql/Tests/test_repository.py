@@ -44,3 +44,33 @@ def test_raise_exception_if_data_does_not_contain_required_columns():
             )
         columns_str = ', '.join(columns)
         assert exec_info.value.message == f'DataFrame must contain ({columns_str}) but got (col_1, col_2)'
+
+
+@pytest.mark.parametrize(
+    'queries, kwargs, execute_kwargs', [
+        (RepositoryQueries(), {}, {}),
+        (RepositoryQueries(parallel_main=True), {}, {'parallel_main': True}),
+        (RepositoryQueries(), {'parallel_main': True}, {'parallel_main': True}),
+        (RepositoryQueries(parallel_main=True), {'parallel_main': False}, {}),
+        (RepositoryQueries(memoize_prep=True), {}, {'memoize_prep': True}),
+        (RepositoryQueries(), {'memoize_prep': True}, {'memoize_prep': True}),
+        (RepositoryQueries(memoize_prep=True), {'memoize_prep': False}, {}),
+    ]
+)
+def test_get_data_passes_execute_flags(
+    queries: RepositoryQueries,
+    kwargs: Dict[str, Any],
+    execute_kwargs: Dict[str, Any],
+):
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        calls = []
+
+        def mock_execute(prep_queries, main_query, main_queries, **kwargs):
+            calls.append(kwargs)
+            return {}
+
+        query_executor = SQLiteQueryExecutor()
+        monkeypatch.setattr(query_executor, 'execute', mock_execute)
+        Repository(queries=queries, query_executor=query_executor).get_data(**kwargs)
+        assert calls == [execute_kwargs]
+
@@ -0,0 +1,15 @@
+import os
+from pathlib import Path
+from toolbox.sql.sql_query import SqlQuery
+
+
+def test_sql_query_rereads_changed_file(tmp_path: Path):
+    query_file = tmp_path / 'query.sql'
+    query_file.write_text('SELECT {col} FROM tbl', encoding='utf-8')
+    assert SqlQuery(str(query_file), {'col': 'a'}).get_script() == 'SELECT a FROM tbl'
+    assert SqlQuery(str(query_file), {'col': 'b'}).get_script() == 'SELECT b FROM tbl'
+
+    query_file.write_text('SELECT {col} FROM tbl2', encoding='utf-8')
+    mtime_ns = os.stat(query_file).st_mtime_ns + 1_000_000
+    os.utime(query_file, ns=(mtime_ns, mtime_ns))
+    assert SqlQuery(str(query_file), {'col': 'a'}).get_script() == 'SELECT a FROM tbl2'
@@ -24,6 +24,9 @@ class Transaction(AbstractContextManager, Protocol):
     def executemany(self, *kargs, **kwargs):
         pass
 
+    def commit(self):
+        pass
+
 
 class DbEngine(Protocol):
 
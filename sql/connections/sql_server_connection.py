@@ -1,4 +1,5 @@
 from functools import partial
+from urllib.parse import quote
 from sqlalchemy import create_engine, event
 from sqlalchemy.engine import Engine
 from sqlalchemy.pool import NullPool
@@ -19,6 +20,11 @@ if config.production():
         url=url,
         #poolclass=NullPool,
         pool_reset_on_return=None,
+        pool_size=config.sql_pool_size(),
+        max_overflow=config.sql_max_overflow(),
+        pool_pre_ping=True,
+        pool_recycle=1800,
+        fast_executemany=True,
     )
 
     @event.listens_for(_engine, 'reset')
@@ -30,4 +36,15 @@ if config.production():
         dbapi_connection.rollback()
 
 
+def arrow_url() -> str:
+    """
+    Connection string in the connectorx format.
+    """
+    return (
+        'mssql://' + quote(config.sql_user(), safe='') + ':' + quote(config.sql_password(), safe='')
+        + '@' + config.sql_server() + '/' + config.sql_database()
+        + '?encrypt=true&trust_server_certificate=true'
+    )
+
+
 SqlServerConnection = partial(Connection, db_engine=_engine)
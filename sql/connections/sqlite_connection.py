@@ -4,10 +4,32 @@ from functools import partial
 from toolbox.sql.connections.connection import Connection
 
 
+PRAGMAS = '''
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-8000;
+PRAGMA mmap_size=268435456;
+PRAGMA wal_autocheckpoint=1000;
+'''
+
+
 class SQLiteDataBase:
 
     def begin(self):
-        return sqlite3.connect(database=config.sqlite_database())
+        conn = sqlite3.connect(database=config.sqlite_database())
+        conn.executescript(PRAGMAS)
+        return conn
+
+    def checkpoint(self):
+        """
+        Moves WAL content into the db file and truncates the WAL.
+        """
+        conn = self.begin()
+        try:
+            conn.execute('PRAGMA wal_checkpoint(TRUNCATE);')
+        finally:
+            conn.close()
 
 
 SqliteConnection = partial(Connection, db_engine=SQLiteDataBase())
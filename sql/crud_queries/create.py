@@ -152,5 +152,5 @@ class SqliteCreateTableFromTableQuery(SqliteCreateTableQuery):
             return ''
         return on_conflict(
             key_cols=self._unique_fields or self.keys(lambda x: x.target_name),
-            confilcting_cols=self.values(lambda x: x.target_name),
+            conflicting_cols=self.values(lambda x: x.target_name),
         )
@@ -37,7 +37,7 @@ class SqliteUpsertQuery:
     def get_on_conflict(self):
         return on_conflict(
             key_cols=self._key_cols,
-            confilcting_cols=self._confilcting_cols,
+            conflicting_cols=self._confilcting_cols,
         )
 
     def get_parameters(self):
@@ -0,0 +1,80 @@
+import sqlite3
+import pytest
+from pandas import DataFrame
+from toolbox.sql.connections.connection import Connection
+from toolbox.sql.db_operations.save_table import (
+    SaveTableOperationDF,
+    DFToCRUDQueryMapper,
+)
+
+
+@pytest.fixture
+def tran():
+    conn = sqlite3.connect(':memory:')
+    conn.setlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER, 999)
+    yield conn
+    conn.close()
+
+
+@pytest.mark.parametrize(
+    'cols_count, method', [
+        (1, None),
+        (20, None),
+        (20, 'multi'),
+        (999, 'multi'),
+    ]
+)
+def test_save_table_df_fits_sqlite_variables_limit(tran, cols_count: int, method):
+    df = DataFrame({f'col{i}': range(1500) for i in range(cols_count)})
+    SaveTableOperationDF(
+        conn=Connection(db_engine=None),
+        query=DFToCRUDQueryMapper('tbl', df),
+        method=method,
+    )(tran=tran)
+    assert tran.execute('SELECT COUNT(*) FROM tbl').fetchone() == (1500, )
+
+
+class DialectMock:
+
+    def __init__(self, name: str, supports_multivalues_insert: bool = True):
+        self.name = name
+        self.supports_multivalues_insert = supports_multivalues_insert
+
+
+class TransactionMock:
+
+    def __init__(self, dialect: DialectMock):
+        self.dialect = dialect
+
+
+@pytest.mark.parametrize(
+    'dialect, cols_count, method, res', [
+        (DialectMock('mssql'), 2, 'multi', ('multi', 1000)),
+        (DialectMock('mssql'), 3, 'multi', ('multi', 699)),
+        (DialectMock('mssql'), 100, 'multi', ('multi', 20)),
+        (DialectMock('mssql'), 2100, 'multi', (None, 1000)),
+        (DialectMock('mssql'), 3, None, (None, 1000)),
+        (DialectMock('postgresql'), 3, 'multi', ('multi', 1000)),
+        (DialectMock('mssql', False), 3, 'multi', (None, 1000)),
+    ]
+)
+def test_save_table_df_fits_dialect_variables_limit(
+    dialect: DialectMock,
+    cols_count: int,
+    method,
+    res,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    calls = []
+
+    def to_sql(self, **kwargs):
+        calls.append((kwargs['method'], kwargs['chunksize']))
+
+    monkeypatch.setattr(DataFrame, 'to_sql', to_sql)
+    df = DataFrame({f'col{i}': [1] for i in range(cols_count)})
+    SaveTableOperationDF(
+        conn=Connection(db_engine=None),
+        query=DFToCRUDQueryMapper('tbl', df),
+        method=method,
+    )(tran=TransactionMock(dialect))
+    assert calls == [res]
@@ -1,4 +1,5 @@
-from collections.abc import Mapping, Iterable
+import sqlite3
+from collections.abc import Mapping, Iterable, Callable
 from typing import NamedTuple
 from pandas import DataFrame
 from toolbox.sql.crud_queries.protocols import CRUDQuery
@@ -16,12 +17,12 @@ class SaveTableOperation(DbConnectable):
         self,
         conn: Connection,
         query: CRUDQuery,
-        tables_defs: Mapping[str, str] = {},
+        tables_defs: Mapping[str, str] | None = None,
         create_index_statements: Mapping[str, str] | Iterable[str] = None,
     ) -> None:
         super().__init__(conn)
         self._query = query
-        self._tables_defs = tables_defs
+        self._tables_defs = tables_defs or {}
         self._create_index_statements = create_index_statements
 
     @with_transaction
@@ -76,12 +77,75 @@ class DFToCRUDQueryMapper(NamedTuple):
 
 
 class SaveTableOperationDF(SaveTableOperation):
+    """
+    Saves a DataFrame in a single transaction.
+    Rows are inserted via executemany in batches of batch_size rows.
+    method='multi' sends each batch as one multi-row INSERT.
+    On sqlite and sql server the batch is capped so it fits the bind parameters limit;
+    tables too wide for a single row fall back to executemany, as do
+    dialects which don't support multi-row inserts.
+    tables_defs and create_index_statements are executed via executescript,
+    so they require a sqlite connection.
+    """
+
+    def __init__(
+        self,
+        conn: Connection,
+        query: CRUDQuery,
+        tables_defs: Mapping[str, str] | None = None,
+        create_index_statements: Mapping[str, str] | Iterable[str] = None,
+        batch_size: int | None = 1000,
+        method: str | Callable | None = None,
+    ) -> None:
+        super().__init__(conn, query, tables_defs, create_index_statements)
+        self._batch_size = batch_size
+        self._method = method
 
     def _save_table(self, tran: Transaction, tbl_exists: bool):
         df = self._query.get_script()
+        method, chunksize = self.__get_method(tran, len(df.columns))
         df.to_sql(
             name=self._query.get_table_name(),
             con=tran,
             if_exists='append' if tbl_exists else 'replace',
             index=False,
+            chunksize=chunksize,
+            method=method,
         )
+
+    def __get_method(
+        self,
+        tran: Transaction,
+        cols_count: int,
+    ) -> tuple[str | Callable | None, int | None]:
+        if self._method != 'multi':
+            return self._method, self._batch_size
+
+        dialect = getattr(tran, 'dialect', None)
+        if not getattr(dialect, 'supports_multivalues_insert', True):
+            return None, self._batch_size
+
+        max_variables = _max_variables(tran)
+        if max_variables is None:
+            return self._method, self._batch_size
+
+        max_rows = max_variables // max(cols_count, 1)
+        if not max_rows:
+            return None, self._batch_size
+        return self._method, min(self._batch_size or max_rows, max_rows)
+
+
+# Max bind parameters per statement.
+_DIALECT_MAX_VARIABLES = {
+    'mssql': 2099,
+    'sqlite': 999,
+}
+
+
+def _max_variables(tran: Transaction) -> int | None:
+    if isinstance(tran, sqlite3.Connection):
+        if hasattr(tran, 'getlimit'):
+            return tran.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+        return _DIALECT_MAX_VARIABLES['sqlite']
+    dialect = getattr(tran, 'dialect', None)
+    return _DIALECT_MAX_VARIABLES.get(getattr(dialect, 'name', None), None)
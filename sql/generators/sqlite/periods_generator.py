@@ -104,7 +104,7 @@ async def generate_periods(
 
 class SqlitePeriodsQueryAsync(AsyncSqlQuery):
 
-    def __init__(self, format_params: Mapping[str, str] = {}) -> None:
+    def __init__(self, format_params: Mapping[str, str] | None = None) -> None:
         super().__init__(
             query_file_path='',
             fields_mapping=PeriodsMeta.get_attrs(),
@@ -1,5 +1,8 @@
 from collections.abc import Iterable
-from toolbox.sql.generators.utils import multiline_non_empty
+from functools import lru_cache
+
+
+_UPDATES_SEP = ',\n\t\t'
 
 
 def create_index(
@@ -9,7 +12,18 @@ def create_index(
     name: str = '',
     unique: bool = False,
 ) -> str:
-    cols = tuple(str(col) for col in cols)
+    if not (isinstance(cols, tuple) and all(type(col) is str for col in cols)):
+        cols = tuple(map(str, cols))
+    return _create_index(tbl, cols, name, unique)
+
+
+@lru_cache(maxsize=256)
+def _create_index(
+    tbl: str,
+    cols: tuple[str, ...],
+    name: str,
+    unique: bool,
+) -> str:
     unq = 'UNIQUE ' if unique else ''
     name = name if name else "_".join(cols)
     return f'CREATE {unq}INDEX IF NOT EXISTS idx_{tbl}_{name} ON {tbl}({", ".join(cols)});'
@@ -17,15 +31,30 @@ def create_index(
 
 def on_conflict(
     key_cols: Iterable[str],
-    confilcting_cols: Iterable[str],
+    conflicting_cols: Iterable[str] = (),
+    *,
+    confilcting_cols: Iterable[str] | None = None,
 ):
-    if key_cols and confilcting_cols:
-        return multiline_non_empty(
-            f"ON CONFLICT({', '.join(key_cols)}) DO UPDATE SET",
-            '\t\t' + ',\n\t\t'.join(
-                f'{col}=excluded.{col}' for col in confilcting_cols
-            ),
-        )
+    """
+    confilcting_cols is a deprecated alias of conflicting_cols.
+    """
+    if confilcting_cols is not None:
+        conflicting_cols = confilcting_cols
+    return _on_conflict(
+        tuple(str(col) for col in key_cols),
+        tuple(str(col) for col in conflicting_cols),
+    )
+
+
+@lru_cache(maxsize=256)
+def _on_conflict(
+    key_cols: tuple[str, ...],
+    conflicting_cols: tuple[str, ...],
+) -> str:
+    if key_cols and conflicting_cols:
+        keys = ', '.join(key_cols)
+        updates = _UPDATES_SEP.join([f'{col}=excluded.{col}' for col in conflicting_cols])
+        return f'ON CONFLICT({keys}) DO UPDATE SET\n\t\t{updates}'
     return 'ON CONFLICT DO NOTHING'
 
 
@@ -0,0 +1,183 @@
+import sqlite3
+import threading
+import pytest
+from contextlib import closing, contextmanager
+from pathlib import Path
+from sqlalchemy import create_engine, text
+from toolbox.sql.connections.connection import Connection
+from toolbox.sql.sql_query import GeneralSelectSqlQuery
+from toolbox.sql.query_executors.sql_query_executor import SqlQueryExecutor
+from toolbox.sql.query_executors.sqlite_query_executor import SQLiteQueryExecutor
+
+
+class CountingConnection(sqlite3.Connection):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.scripts = []
+
+    def executescript(self, script):
+        self.scripts.append(script)
+        return super().executescript(script)
+
+
+class CommitCountingConnection(sqlite3.Connection):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commits = 0
+
+    def commit(self):
+        self.commits += 1
+        return super().commit()
+
+
+class CountingEngine:
+
+    def __init__(self, db: Path):
+        self.db = db
+        self.lock = threading.Lock()
+        self.opened = 0
+        self.max_opened = 0
+
+    @contextmanager
+    def begin(self):
+        with self.lock:
+            self.opened += 1
+            self.max_opened = max(self.max_opened, self.opened)
+        try:
+            with closing(sqlite3.connect(self.db)) as conn, conn:
+                yield conn
+        finally:
+            with self.lock:
+                self.opened -= 1
+
+
+class TransactionMock:
+
+    def __init__(self):
+        self.calls = []
+
+    def execute(self, script):
+        self.calls.append(('execute', script))
+
+    def executescript(self, script):
+        self.calls.append(('executescript', script))
+
+
+def test_execute_nonquery_batches_sqlite_scripts():
+    tran = sqlite3.connect(':memory:', factory=CountingConnection)
+    SqlQueryExecutor(Connection(db_engine=None)).execute_nonquery(
+        'CREATE TABLE a(x); -- trailing comment',
+        'INSERT INTO a VALUES(1) -- no semicolon',
+        'INSERT INTO a VALUES(2);',
+        tran=tran,
+    )
+    assert len(tran.scripts) == 1
+    assert tran.execute('SELECT x FROM a ORDER BY x').fetchall() == [(1, ), (2, )]
+
+
+def test_execute_nonquery_runs_text_clauses_one_by_one():
+    tran = TransactionMock()
+    queries = (text('SELECT 1'), text('SELECT 2'))
+    SqlQueryExecutor(Connection(db_engine=None)).execute_nonquery(*queries, tran=tran)
+    assert tran.calls == [('executescript', query) for query in queries]
+
+
+def select_all(tbl: str) -> GeneralSelectSqlQuery:
+    return GeneralSelectSqlQuery({'select': '*', 'from': tbl, 'where_group_limit': ''})
+
+
+@pytest.mark.parametrize('engine', ['sqlite3', 'sqlalchemy'])
+def test_execute_parallel_main_queries(
+    engine: str,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    db = tmp_path / 'db.sqlite'
+    if engine == 'sqlite3':
+        monkeypatch.setenv('SQLITE_DATABASE', str(db))
+        executor = SQLiteQueryExecutor()
+        prep_queries = ('CREATE TABLE a AS SELECT 1 AS x', 'CREATE TABLE b AS SELECT 2 AS y')
+    else:
+        executor = SqlQueryExecutor(Connection(db_engine=create_engine(f'sqlite:///{db}')))
+        prep_queries = (text('CREATE TABLE a AS SELECT 1 AS x'), text('CREATE TABLE b AS SELECT 2 AS y'))
+
+    threads = set()
+    execute_query = executor._execute_query
+
+    def spy(**kwargs):
+        threads.add(threading.get_ident())
+        return execute_query(**kwargs)
+
+    monkeypatch.setattr(executor, '_execute_query', spy)
+
+    res = executor.execute(
+        prep_queries=prep_queries,
+        main_queries={'a': select_all('a'), 'b': select_all('b')},
+        parallel_main=True,
+    )
+    assert res['a'].to_dict('records') == [{'x': 1}]
+    assert res['b'].to_dict('records') == [{'y': 2}]
+    assert threading.get_ident() not in threads
+
+
+def test_execute_parallel_main_releases_prep_transaction(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    engine = CountingEngine(tmp_path / 'db.sqlite')
+    executor = SqlQueryExecutor(Connection(db_engine=engine))
+    barrier = threading.Barrier(2, timeout=5)
+    execute_query = executor._execute_query
+
+    def spy(**kwargs):
+        barrier.wait()
+        return execute_query(**kwargs)
+
+    monkeypatch.setattr(executor, '_execute_query', spy)
+
+    res = executor.execute(
+        prep_queries=('CREATE TABLE a AS SELECT 1 AS x', 'CREATE TABLE b AS SELECT 2 AS y'),
+        main_queries={'a': select_all('a'), 'b': select_all('b')},
+        parallel_main=True,
+    )
+    assert res['a'].to_dict('records') == [{'x': 1}]
+    assert res['b'].to_dict('records') == [{'y': 2}]
+    assert engine.max_opened == 2
+
+
+def test_execute_parallel_main_keeps_caller_transaction():
+    tran = sqlite3.connect(':memory:', factory=CommitCountingConnection)
+    res = SqlQueryExecutor(Connection(db_engine=None)).execute(
+        prep_queries=('CREATE TABLE a AS SELECT 1 AS x', 'CREATE TABLE b AS SELECT 2 AS y'),
+        main_queries={'a': select_all('a'), 'b': select_all('b')},
+        parallel_main=True,
+        tran=tran,
+    )
+    assert res['a'].to_dict('records') == [{'x': 1}]
+    assert res['b'].to_dict('records') == [{'y': 2}]
+    assert tran.commits == 0
+
+
+@pytest.mark.parametrize(
+    'memoize_prep, rows', [
+        (False, [(1, ), (1, )]),
+        (True, [(1, )]),
+    ]
+)
+def test_execute_memoize_prep_skips_repeated_scripts(
+    memoize_prep: bool,
+    rows: list,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    monkeypatch.setenv('SQLITE_DATABASE', str(tmp_path / 'db.sqlite'))
+    insert = 'INSERT INTO tbl VALUES (1)'
+    SQLiteQueryExecutor().execute(
+        prep_queries=('CREATE TABLE tbl (x)', insert, insert),
+        main_queries={},
+        memoize_prep=memoize_prep,
+    )
+    with closing(sqlite3.connect(tmp_path / 'db.sqlite')) as conn:
+        assert conn.execute('SELECT x FROM tbl').fetchall() == rows
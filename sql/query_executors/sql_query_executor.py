@@ -1,5 +1,6 @@
 from __future__ import annotations
 from collections.abc import Mapping, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Union, Optional
 from pandas import DataFrame, read_sql
 import toolbox.logger as Logger
@@ -13,8 +14,48 @@ from toolbox.sql.connections.connection import (
 
 class SqlQueryExecutor(DbConnectable):
 
-    @with_transaction
     def execute(
+        self,
+        *,
+        prep_queries: Optional[Iterable[SqlQuery]] = None,
+        main_query: Optional[SqlQuery] = None,
+        main_queries: Optional[Mapping[str, SqlQuery]] = None,
+        parallel_main: bool = False,
+        memoize_prep: bool = False,
+        tran: Optional[Transaction] = None,
+    ) -> DataFrame | Mapping[str, DataFrame | str]:
+        """
+        parallel_main runs main_queries concurrently, each in its own transaction.
+        Prep queries are committed in a separate transaction beforehand,
+        so this is only applicable if prep queries don't produce
+        session scoped objects (#temp tables).
+        parallel_main is ignored if tran is passed by the caller.
+        memoize_prep skips prep queries whose script repeats an earlier one in prep_queries.
+        Scripts which aren't idempotent (e.g. INSERT) must not be used with memoize_prep.
+        """
+        if prep_queries and memoize_prep:
+            prep_queries = _unique_scripts(prep_queries)
+
+        if tran is None and parallel_main and not main_query and len(main_queries) > 1:
+            if prep_queries:
+                self.execute_nonquery(*prep_queries)
+            return self._execute_parallel(main_queries)
+
+        if tran is not None:
+            return self._execute(
+                prep_queries=prep_queries,
+                main_query=main_query,
+                main_queries=main_queries,
+                tran=tran,
+            )
+        return self._execute(
+            prep_queries=prep_queries,
+            main_query=main_query,
+            main_queries=main_queries,
+        )
+
+    @with_transaction
+    def _execute(
         self,
         *,
         prep_queries: Optional[Iterable[SqlQuery]] = None,
@@ -26,32 +67,56 @@ class SqlQueryExecutor(DbConnectable):
             self.execute_nonquery(*prep_queries, tran=tran)
 
         if main_query:
-            Logger.debug(main_query)
+            if Logger.enabled():
+                Logger.debug(main_query)
             return self._execute_query(
                 query=main_query,
                 tran=tran,
             )
 
         res = {}
+        debug = Logger.enabled()
         for k, query in main_queries.items():
-            Logger.debug(f'{k} : {query}')
+            if debug:
+                Logger.debug(f'{k} : {query}')
             res[k] = self._execute_query(
                 query=query,
                 tran=tran,
             )
         return res
 
+    def _execute_parallel(
+        self,
+        main_queries: Mapping[str, SqlQuery],
+    ) -> Mapping[str, DataFrame | str]:
+        with ThreadPoolExecutor(max_workers=min(8, len(main_queries))) as executor:
+            futures = {
+                k: executor.submit(self.execute, main_query=query)
+                for k, query in main_queries.items()
+            }
+            return {k: future.result() for k, future in futures.items()}
+
     @with_transaction
     def execute_nonquery(
         self,
         *queries: Union[SqlQuery, str],
         tran: Optional[Transaction] = None,
     ) -> None:
+        scripts = []
+        debug = Logger.enabled()
         for query in queries:
             if hasattr(query, 'get_script'):
                 query = query.get_script()
-            Logger.debug(query)
-            self._execute_script(script=query, tran=tran)
+            if debug:
+                Logger.debug(query)
+            scripts.append(query)
+
+        if len(scripts) > 1 and self._can_batch(scripts, tran):
+            self._execute_script(script='\n;\n'.join(scripts), tran=tran)
+            return
+
+        for script in scripts:
+            self._execute_script(script=script, tran=tran)
 
     def _execute_query(
         self,
@@ -65,6 +130,11 @@ class SqlQueryExecutor(DbConnectable):
             **kwargs,
         )
 
+    def _can_batch(self, scripts: Iterable, tran: Transaction) -> bool:
+        return hasattr(tran, 'executescript') and all(
+            isinstance(script, str) for script in scripts
+        )
+
     def _execute_script(
         self,
         script: str,
@@ -74,6 +144,17 @@ class SqlQueryExecutor(DbConnectable):
         execute(script)
 
 
+def _unique_scripts(queries: Iterable[SqlQuery | str]) -> Iterable[SqlQuery | str]:
+    applied = set()
+    res = []
+    for query in queries:
+        script = str(query.get_script() if hasattr(query, 'get_script') else query)
+        if script not in applied:
+            applied.add(script)
+            res.append(query)
+    return res
+
+
 class SqlNonQueryExecutor(SqlQueryExecutor):
 
     @with_transaction
@@ -83,6 +164,9 @@ class SqlNonQueryExecutor(SqlQueryExecutor):
         prep_queries: Optional[Iterable[SqlQuery]] = None,
         main_query: Optional[SqlQuery] = None,
         main_queries: Optional[Mapping[str, SqlQuery]] = None,
+        memoize_prep: bool = False,
         tran: Optional[Transaction] = None,
     ) -> None:
+        if memoize_prep:
+            prep_queries = _unique_scripts(prep_queries)
         self.execute_nonquery(*prep_queries, tran=tran)
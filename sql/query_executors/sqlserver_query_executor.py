@@ -1,11 +1,19 @@
+from __future__ import annotations
+from collections.abc import Mapping, Iterable
 from functools import partial
+from typing import Optional
+from pandas import DataFrame
 from toolbox.sql.sql_query import SqlQuery
 from toolbox.sql.query_executors.sql_query_executor import (
     SqlQueryExecutor,
     SqlNonQueryExecutor,
+    _unique_scripts,
 )
 from toolbox.sql.connections.connection import Transaction
-from toolbox.sql.connections.sql_server_connection import SqlServerConnection
+from toolbox.sql.connections.sql_server_connection import (
+    SqlServerConnection,
+    arrow_url,
+)
 
 
 SqlServerQueryExecutor = partial(SqlQueryExecutor, conn=SqlServerConnection())
@@ -27,5 +35,59 @@ class SqlServerJsonQueryExecutor(SqlQueryExecutor):
                 extender='\r\nFOR JSON AUTO, INCLUDE_NULL_VALUES'
             )
         )
-        res_json = ''.join(row[0] for row in res_raw.fetchall())
-        return res_json
+        fragments = []
+        while rows := res_raw.fetchmany(4096):
+            fragments.extend(row[0] for row in rows)
+        return ''.join(fragments)
+
+
+class SqlServerArrowQueryExecutor(SqlQueryExecutor):
+    """
+    Reads query results through connectorx (arrow) instead of read_sql.
+    Requires the connectorx package.
+
+    connectorx opens its own connections, so prep queries are committed
+    before main queries run and main queries can't see session scoped
+    objects (#temp tables) created by prep queries.
+    Queries which aren't plain text (e.g. with bound params) fall back to read_sql.
+    read_kwargs (e.g. partition_on, partition_num) are passed to connectorx.read_sql.
+    """
+
+    def __init__(self, **read_kwargs) -> None:
+        super().__init__(conn=SqlServerConnection())
+        self.read_kwargs = read_kwargs
+
+    def execute(
+        self,
+        *,
+        prep_queries: Optional[Iterable[SqlQuery]] = None,
+        main_query: Optional[SqlQuery] = None,
+        main_queries: Optional[Mapping[str, SqlQuery]] = None,
+        parallel_main: bool = False,
+        memoize_prep: bool = False,
+    ) -> DataFrame | Mapping[str, DataFrame]:
+        if prep_queries:
+            if memoize_prep:
+                prep_queries = _unique_scripts(prep_queries)
+            self.execute_nonquery(*prep_queries)
+
+        if main_query:
+            return self._read_arrow(main_query)
+
+        if parallel_main and len(main_queries) > 1:
+            return self._execute_parallel(main_queries)
+
+        return {k: self._read_arrow(query) for k, query in main_queries.items()}
+
+    def _read_arrow(self, query: SqlQuery) -> DataFrame:
+        script = query.get_script()
+        if not isinstance(script, str):
+            return SqlQueryExecutor.execute(self, main_query=query)
+
+        import connectorx
+        return connectorx.read_sql(
+            conn=arrow_url(),
+            query=script,
+            return_type='arrow',
+            **self.read_kwargs,
+        ).to_pandas(split_blocks=True)
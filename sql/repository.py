@@ -8,6 +8,7 @@ from toolbox.sql.query_executors.sqlserver_query_executor import (
     SqlServerJsonQueryExecutor,
     SqlServerQueryExecutor,
     SqlServerNonQueryExecutor,
+    SqlServerArrowQueryExecutor,
     SqlQueryExecutor,
 )
 from toolbox.sql.query_executors.sqlite_query_executor import SQLiteQueryExecutor
@@ -29,10 +30,16 @@ class Repository:
         self.query_executor = query_executor or SqlServerQueryExecutor()
 
     def get_data(self,**kwargs) -> Union[Mapping[str, DataFrame], DataFrame, str]:
+        execute_kwargs = {}
+        if self.queries.get_parallel_main(**kwargs):
+            execute_kwargs['parallel_main'] = True
+        if self.queries.get_memoize_prep(**kwargs):
+            execute_kwargs['memoize_prep'] = True
         query_result = self.query_executor.execute(
             prep_queries=self.queries.get_prep_queries(**kwargs),
             main_query=self.queries.get_main_query(**kwargs),
             main_queries=self.queries.get_main_queries(**kwargs),
+            **execute_kwargs,
         )
 
         if isinstance(query_result, DataFrame):
@@ -61,4 +68,5 @@ class Repository:
 SqlServerJSONBasedRepository = partial(Repository, query_executor=SqlServerJsonQueryExecutor())
 SqlServerRepository = partial(Repository, query_executor=SqlServerQueryExecutor())
 SqlServerNonQueryRepository = partial(Repository, query_executor=SqlServerNonQueryExecutor())
+SqlServerArrowRepository = partial(Repository, query_executor=SqlServerArrowQueryExecutor())
 SqliteRepository = partial(Repository, query_executor=SQLiteQueryExecutor())
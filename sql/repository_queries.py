@@ -11,17 +11,21 @@ class RepositoryQueries:
         self,
         main_query_path: str = None,
         main_query_format_params: Mapping[str, str] = KnotMeta.get_attrs(),
-        must_have_columns: Iterable[str] = [],
-        main_queries: Mapping[str, SqlQuery] = {},
+        must_have_columns: Iterable[str] = tuple(),
+        main_queries: Mapping[str, SqlQuery] | None = None,
         prep_queries: Iterable[SqlQuery] = tuple(),
         sql_query_type: Type[SqlQuery] = SqlQuery,
+        parallel_main: bool = False,
+        memoize_prep: bool = False,
     ) -> None:
         self.main_query_path = main_query_path
         self.main_query_format_params = main_query_format_params
         self.must_have_columns = must_have_columns
-        self.main_queries = main_queries
+        self.main_queries = main_queries or {}
         self.prep_queries = prep_queries
         self.sql_query_type = sql_query_type
+        self.parallel_main = parallel_main
+        self.memoize_prep = memoize_prep
 
     def get_main_query_path(self, **kwargs) -> str:
         return kwargs.get('query_file_path', self.main_query_path)
@@ -32,6 +36,18 @@ class RepositoryQueries:
     def get_must_have_columns(self, **kwargs) -> Iterable[str]:
         return kwargs.get('must_have_columns', self.must_have_columns)
 
+    def get_parallel_main(self, **kwargs) -> bool:
+        """
+        Whether main queries may run concurrently, see SqlQueryExecutor.execute.
+        """
+        return kwargs.get('parallel_main', self.parallel_main)
+
+    def get_memoize_prep(self, **kwargs) -> bool:
+        """
+        Whether repeated prep queries may be skipped, see SqlQueryExecutor.execute.
+        """
+        return kwargs.get('memoize_prep', self.memoize_prep)
+
     def get_main_query(self, **kwargs) -> SqlQuery:
         if not self.get_main_query_path(**kwargs):
             return None
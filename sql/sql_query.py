@@ -1,4 +1,6 @@
+import os
 from collections.abc import Mapping
+from functools import lru_cache
 from pathlib import Path
 from sqlalchemy import text
 
@@ -27,7 +29,15 @@ class SqlQuery:
         return self._cached_query
 
     def _get_raw_query(self) -> str:
-        return Path(self._file_path).read_text(encoding='utf-8')
+        return _read_query(self._file_path, os.stat(self._file_path).st_mtime_ns)
+
+
+@lru_cache(maxsize=512)
+def _read_query(file_path: str, mtime_ns: int) -> str:
+    """
+    Query files are reread only when they change on disc.
+    """
+    return Path(file_path).read_text(encoding='utf-8')
 
 
 class SqlAlchemyQuery(SqlQuery):
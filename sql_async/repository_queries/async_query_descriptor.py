@@ -10,7 +10,7 @@ class AsyncQueryDescriptor(QueryDescriptor):
         self,
         path: str = None,
         fields_meta: MetaData = None,
-        format_params: Mapping[str, str] = {},
+        format_params: Mapping[str, str] | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -27,7 +27,7 @@ class GeneralSelectAsyncQueryDescriptor(QueryDescriptor):
     def __init__(
         self,
         fields_meta: MetaData = None,
-        format_params: Mapping[str, str] = {},
+        format_params: Mapping[str, str] | None = None,
         **kwargs,
     ) -> None:
         super().__init__(
@@ -12,12 +12,12 @@ class QueryDescriptor(Generic[T]):
         self,
         path: str = None,
         fields_meta: MetaData = None,
-        format_params: Mapping[str, str] = {},
+        format_params: Mapping[str, str] | None = None,
         query_type: T = T,
         **kwargs,
     ) -> None:
         self.path = path
-        self.format_params = format_params
+        self.format_params = format_params or {}
         self.fields_meta = fields_meta
         self.query_type = query_type
         self.kwargs = kwargs
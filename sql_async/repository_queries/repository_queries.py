@@ -11,11 +11,11 @@ class RepositoryQueries(Generic[T]):
     def __init__(
         self,
         main_query: QueryDescriptor[T],
-        main_queries: Mapping[str, QueryDescriptor[T]] = {},
+        main_queries: Mapping[str, QueryDescriptor[T]] | None = None,
         prep_queries: Iterable[QueryDescriptor[T]] = tuple()
     ) -> None:
         self.main_query = main_query
-        self.main_queries = main_queries
+        self.main_queries = main_queries or {}
         self.prep_queries = prep_queries
 
     def get_main_query(self, kwargs: Mapping) -> T:
@@ -14,13 +14,13 @@ class AsyncSqlQuery:
         query_file_path: str,
         fields_mapping: Mapping[str, str],
         fields: Sequence[str],
-        format_params: Mapping[str, str] = {},
+        format_params: Mapping[str, str] | None = None,
         formatter: Callable[[Sequence[str], str], str] = json_array_of_objects,
     ) -> None:
         self._file_path = query_file_path
         self.fields_mapping = fields_mapping
         self.fields = fields
-        self.format_params = format_params
+        self.format_params = format_params or {}
         self.formatter = formatter
 
     async def get_script(self) -> str:
@@ -50,7 +50,7 @@ class GeneralSelectAsyncSqlQuery(AsyncSqlQuery):
         self,
         fields_mapping: Mapping[str, str],
         fields: Sequence[str],
-        format_params: Mapping[str, str] = {},
+        format_params: Mapping[str, str] | None = None,
         formatter: Callable[[Sequence[str], str], str] = json_array_of_objects,
         **kwargs,
     ) -> None:
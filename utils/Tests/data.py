@@ -1,3 +1,6 @@
+from typing import NamedTuple
+
+
 df_data = {
     'ds':
         [
@@ -21,6 +24,11 @@ ds_data = {
 }
 
 
+class TstPoint(NamedTuple):
+    x: int
+    y: int
+
+
 class TstClass:
 
     def __init__(self, abbr: str):
@@ -1,12 +1,14 @@
 import pytest
+import numpy as np
 from typing import Callable, Any
-from pandas import DataFrame
-from datetime import datetime
+from pandas import DataFrame, Series, to_datetime
+from datetime import date, datetime
 from pandas.testing import assert_frame_equal
 from toolbox.utils.Tests.data import (
     df_data,
     ds_data,
     TstClass,
+    TstPoint,
 )
 
 from toolbox.utils.converters import (
@@ -41,7 +43,7 @@ from toolbox.utils.converters import (
         (
             Object_to_JSON.convert,
             [1, 2, 3],
-            '[1, 2, 3]',
+            '[1,2,3]',
         ),
         (
             Objects_to_JSON.convert,
@@ -50,12 +52,37 @@ from toolbox.utils.converters import (
                 TstClass('asd'),
                 TstClass('3'),
             ],
-            '["qwe", "asd", "3"]',
+            '["qwe","asd","3"]',
+        ),
+        (
+            Object_to_JSON.convert,
+            {'point': TstPoint(1, 2), 'points': [TstPoint(3, 4)]},
+            '{"point":[1,2],"points":[[3,4]]}',
+        ),
+        (
+            Object_to_JSON.convert,
+            [2**64, 1],
+            '[18446744073709551616,1]',
         ),
         (
             Objects_to_JSON.convert,
             [1, 2, 3],
-            '[1, 2, 3]',
+            '[1,2,3]',
+        ),
+        (
+            Objects_to_JSON.convert,
+            np.array([1, 2, 3]),
+            '[1,2,3]',
+        ),
+        (
+            Objects_to_JSON.convert,
+            Series([1.5, 2.5]),
+            '[1.5,2.5]',
+        ),
+        (
+            Objects_to_JSON.convert,
+            [np.int64(1), 2.5, 'a'],
+            '[1,2.5,"a"]',
         ),
         (
             DateTimeToSqlString.convert,
@@ -90,6 +117,40 @@ def test_converter(
         assert convert(args) == result
 
 
+@pytest.mark.parametrize('chunksize', [1, 2, 3, 100])
+def test_DF_to_JSON_convert_chunks(chunksize: int):
+    df = DataFrame(data=df_data)
+    res = ''.join(DF_to_JSON.convert_chunks(df, chunksize=chunksize))
+    assert res == DF_to_JSON.convert(df)
+
+
+def test_DF_to_JSON_convert_chunks_empty_df():
+    assert ''.join(DF_to_JSON.convert_chunks(DataFrame())) == '[]'
+
+
+@pytest.mark.parametrize(
+    'df, dt_cols', [
+        (DataFrame(data=df_data), []),
+        (DataFrame({'ds': to_datetime(df_data['ds']), 'y': df_data['y']}), ['ds']),
+        (DataFrame({'ds': to_datetime(ds_data['ds'])}), ['ds']),
+        (DataFrame({'x': [0.1 + 0.2, 1.5, None]}), []),
+        (DataFrame({'d': [date(2022, 1, 1), date(2022, 2, 1)]}), []),
+        (DataFrame({'ds': [None], 'a': [1]}), ['ds']),
+        (DataFrame({'ds': [1672531200000, 1675209600000]}), ['ds']),
+        (DataFrame({'ds': ['2023-01-01T00:00:00.000', '2023-02-01T00:00:00.000Z']}), ['ds']),
+    ]
+)
+@pytest.mark.parametrize('utc', [True, False])
+def test_polars_backend_matches_pandas(df: DataFrame, dt_cols: list, utc: bool):
+    pytest.importorskip('polars')
+    pytest.importorskip('pyarrow')
+    df_json = DF_to_JSON.convert(df, backend='polars')
+    assert df_json == DF_to_JSON.convert(df)
+
+    res = JSON_to_DF.convert(df_json, dt_cols=dt_cols, utc=utc, backend='polars')
+    assert_frame_equal(res, JSON_to_DF.convert(df_json, dt_cols=dt_cols, utc=utc))
+
+
 def test_JSON_to_DF_raises_ValueError_if_json_is_empty():
     with pytest.raises(ValueError) as exec_info:
         JSON_to_DF.convert(json='')
@@ -119,5 +180,43 @@ def test_DateTimeColumnsConverter(df: DataFrame, result: str, drop_utc: bool):
     assert str(df['ds'].dtype) == result
 
 
+@pytest.mark.parametrize(
+    'df,result,drop_utc', [
+        (
+            DataFrame({'ds': Series([], dtype=object)}),
+            'datetime64[ns, UTC]',
+            False,
+        ),
+        (
+            DataFrame({'ds': Series([], dtype=object)}),
+            'datetime64[ns]',
+            True,
+        ),
+        (
+            DataFrame({'ds': to_datetime(ds_data['ds'])}),
+            'datetime64[ns, UTC]',
+            False,
+        ),
+        (
+            DataFrame({'ds': to_datetime(ds_data['ds']).tz_localize(None)}),
+            'datetime64[ns]',
+            True,
+        ),
+        (
+            DataFrame({'ds': [1666220400000000000, 1666224000000000000]}),
+            'datetime64[ns, UTC]',
+            False,
+        ),
+    ]
+)
+def test_DateTimeColumnsConverter_non_string_cols(df: DataFrame, result: str, drop_utc: bool):
+    DateTimeColumnsConverter.convert(
+        df=df,
+        cols=['ds', 'missing'],
+        drop_utc=drop_utc,
+    )
+    assert str(df['ds'].dtype) == result
+
+
 def test_to_quoted_string():
     assert to_quoted_string(1) == "'1'"
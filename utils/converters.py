@@ -1,22 +1,46 @@
+import io
 import json
-import numbers
-from collections.abc import Iterable, Callable
+import orjson
+import numpy as np
+from collections.abc import Iterable, Iterator, Callable
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 from datetime import date, datetime
 from dateutil.parser import isoparse
-from pandas import DataFrame, read_json, to_datetime
+from pandas import DataFrame, Series, read_json, to_datetime
+from pandas.api.types import is_object_dtype, is_string_dtype
+
+
+Backend = Literal['pandas', 'polars']
 
 
 class DF_to_JSON:
 
     @staticmethod
-    def convert(df: DataFrame, orient: str = 'records') -> str:
+    def convert(
+        df: DataFrame,
+        orient: str = 'records',
+        backend: Backend = 'pandas',
+    ) -> str:
+        if backend == 'polars':
+            if orient != 'records':
+                raise ValueError('polars backend supports records orient only')
+            return _df_to_json_polars(df)
         return df.to_json(
             orient=orient,
             date_format='iso',
         )
 
+    @staticmethod
+    def convert_chunks(df: DataFrame, chunksize: int = 100_000) -> Iterator[str]:
+        yield '['
+        for start in range(0, len(df), chunksize):
+            if start:
+                yield ','
+            chunk = DF_to_JSON.convert(df.iloc[start:start + chunksize])
+            yield chunk[1:-1]
+        yield ']'
+
 
 class JSON_to_DF:
 
@@ -25,10 +49,14 @@ class JSON_to_DF:
         json: str,
         dt_cols: Iterable[str] = tuple(),
         utc: bool = True,
+        backend: Backend = 'pandas',
     ) -> DataFrame:
         if not json:
             raise ValueError('Empty response')
 
+        if backend == 'polars':
+            return _json_to_df_polars(json, dt_cols, utc)
+
         df = read_json(
             json,
             orient='records',
@@ -50,12 +78,7 @@ class DateTimeColumnsConverter:
     ):
         for col in cols:
             if col in df.columns:
-                df[col] = to_datetime(
-                    df[col],
-                    utc=utc,
-                )
-                if drop_utc:
-                    df[col] = df[col].dt.tz_localize(None)
+                df[col] = _to_datetime(df[col], utc, drop_utc)
 
     @staticmethod
     def convert_many(
@@ -77,8 +100,10 @@ class Objects_to_JSON:
 
     @staticmethod
     def convert(objects: Iterable) -> str:
+        if _is_numeric_array(objects):
+            return Object_to_JSON.convert(np.ascontiguousarray(objects))
         str_objects = [
-            obj if isinstance(obj, numbers.Number) else str(obj)
+            obj if isinstance(obj, _NUMERIC) else str(obj)
             for obj in objects
         ]
         return Object_to_JSON.convert(str_objects)
@@ -88,14 +113,22 @@ class Object_to_JSON:
 
     @staticmethod
     def convert(obj) -> str:
-        return json.dumps(obj)
+        try:
+            return orjson.dumps(
+                obj,
+                default=_tuple_to_list,
+                option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ).decode()
+        except orjson.JSONEncodeError:
+            # e.g. ints beyond 64 bits which orjson rejects.
+            return json.dumps(obj, separators=(',', ':'))
 
 
 class JSON_to_object:
 
     @staticmethod
-    def convert(json_obj: str) -> Any:
-        return json.loads(json_obj)
+    def convert(json_obj: str | bytes) -> Any:
+        return orjson.loads(json_obj)
 
 
 class DateTimeToSqlString:
@@ -112,6 +145,96 @@ class DateTimeToSqlString:
         )
 
 
+def _df_to_json_polars(df: DataFrame) -> str:
+    """
+    Mirrors df.to_json(orient='records', date_format='iso'):
+    dates are written as ISO strings with ms precision and
+    floats are rounded to pandas' default double_precision (10).
+    Floats that pandas writes in exponent notation may still be spelled differently.
+    """
+    import polars as pl
+    import polars.selectors as cs
+    iso = '%Y-%m-%dT%H:%M:%S%.3f'
+    return pl.from_pandas(df, rechunk=False).with_columns(
+        cs.float().round(10),
+        cs.date().cast(pl.Datetime).dt.strftime(iso),
+        cs.datetime(time_zone=None).dt.strftime(iso),
+        cs.datetime(time_zone='*').dt.convert_time_zone('UTC').dt.strftime(iso + 'Z'),
+    ).write_json()
+
+
+def _json_to_df_polars(
+    json: str,
+    dt_cols: Iterable[str],
+    utc: bool,
+) -> DataFrame:
+    """
+    Parses dt_cols the way DateTimeColumnsConverter does:
+    strings with an offset (e.g. ...Z) are always parsed as UTC,
+    naive strings are parsed as UTC only if utc is set.
+    Columns polars can't parse as is (nulls, epoch ints, naive strings mixed
+    with offset ones) are handed over to DateTimeColumnsConverter.
+    """
+    import polars as pl
+    df = pl.read_json(io.StringIO(json))
+    dt_cols = [col for col in dt_cols if col in df.columns]
+    str_cols = [col for col in dt_cols if _is_uniform_datetime(df[col])]
+    if str_cols:
+        df = df.with_columns(
+            pl.col(col).str.to_datetime(
+                time_zone='UTC' if utc or _has_offset(df[col]) else None,
+            ).dt.cast_time_unit('ns') for col in str_cols
+        )
+    res = df.to_pandas()
+    DateTimeColumnsConverter.convert(
+        res,
+        [col for col in dt_cols if col not in str_cols],
+        utc,
+    )
+    return res
+
+
+def _is_uniform_datetime(col) -> bool:
+    import polars as pl
+    if col.dtype != pl.String:
+        return False
+    offsets = col.str.contains(_OFFSET)
+    return offsets.all() or not offsets.any()
+
+
+def _has_offset(col) -> bool:
+    return bool(col.str.contains(_OFFSET).any())
+
+
+_OFFSET = r'(Z|[+-]\d\d:?\d\d)$'
+
+
+def _to_datetime(col: Series, utc: bool, drop_utc: bool) -> Series:
+    # ISO 8601 strings (as written by DF_to_JSON) skip per-value format inference.
+    format = 'ISO8601' if is_object_dtype(col) or is_string_dtype(col) else None
+    col = to_datetime(col, utc=utc, format=format)
+    return col.dt.tz_localize(None) if drop_utc else col
+
+
+def _tuple_to_list(obj) -> list:
+    # NamedTuples are tuple subclasses which orjson doesn't serialize.
+    if isinstance(obj, tuple):
+        return list(obj)
+    raise TypeError
+
+
+_NUMERIC = (int, float, np.integer, np.floating)
+
+
+def _is_numeric_array(objects: Iterable) -> bool:
+    return (
+        isinstance(objects, (np.ndarray, Series))
+        and objects.ndim == 1
+        and isinstance(objects.dtype, np.dtype)
+        and objects.dtype.kind in 'iuf'
+    )
+
+
 def isostr_to_date(dt: str) -> datetime:
     return isoparse(dt)
 
@@ -0,0 +1,155 @@
+import asyncio
+import pytest
+from fastapi import status
+from fastapi.responses import Response
+import toolbox.utils.fastapi.decorators as decorators
+from toolbox.utils.fastapi.decorators import with_authorization
+
+
+class AuthResponseMock:
+
+    def __init__(self, status: int):
+        self.status = status
+
+
+class SessionMock:
+
+    def __init__(self, status: int = status.HTTP_200_OK):
+        self.status = status
+        self.requests = []
+
+    def get(self, url: str, headers: dict):
+        self.requests.append((url, headers))
+        return self
+
+    async def __aenter__(self):
+        return AuthResponseMock(self.status)
+
+    async def __aexit__(self, *args):
+        pass
+
+
+class AuthCheckMock:
+
+    def __init__(self, result=None):
+        self.result = result
+        self.calls = 0
+
+    async def __call__(self, response: AuthResponseMock):
+        self.calls += 1
+        if self.result is not None:
+            return self.result
+        return response.status == status.HTTP_200_OK
+
+
+@pytest.fixture(autouse=True)
+def env(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv('AUTH_ENABLED', '1')
+    monkeypatch.setenv('AUTH_ENDPOINT', 'http://auth')
+    getattr(decorators, '__cache').clear()
+
+
+def mock_session(monkeypatch: pytest.MonkeyPatch, session: SessionMock):
+
+    async def get_session():
+        return session
+
+    monkeypatch.setattr(decorators, '_get_session', get_session)
+
+
+def decorate(auth_check: AuthCheckMock):
+
+    @with_authorization(auth_check)
+    async def endpoint(access_token: str, response: Response, **kwargs):
+        return kwargs
+
+    return endpoint
+
+
+def call(endpoint, access_token: str = 'token'):
+    response = Response()
+    res = asyncio.run(endpoint(access_token=access_token, response=response))
+    return res, response.status_code
+
+
+def test_cache_hit_after_miss(monkeypatch: pytest.MonkeyPatch):
+    session = SessionMock()
+    mock_session(monkeypatch, session)
+    auth_check = AuthCheckMock()
+    endpoint = decorate(auth_check)
+
+    assert call(endpoint) == ({}, status.HTTP_200_OK)
+    assert call(endpoint) == ({}, status.HTTP_200_OK)
+    assert session.requests == [('http://auth', {'Authorization': 'token'})]
+    assert auth_check.calls == 1
+
+
+def test_negative_result_is_cached(monkeypatch: pytest.MonkeyPatch):
+    session = SessionMock(status.HTTP_401_UNAUTHORIZED)
+    mock_session(monkeypatch, session)
+    auth_check = AuthCheckMock()
+    endpoint = decorate(auth_check)
+
+    assert call(endpoint) == (None, status.HTTP_403_FORBIDDEN)
+    assert call(endpoint) == (None, status.HTTP_403_FORBIDDEN)
+    assert len(session.requests) == 1
+    assert auth_check.calls == 1
+
+
+def test_mapping_result_is_merged_into_kwargs(monkeypatch: pytest.MonkeyPatch):
+    session = SessionMock()
+    mock_session(monkeypatch, session)
+    endpoint = decorate(AuthCheckMock({'user': 'qwe'}))
+
+    assert call(endpoint) == ({'user': 'qwe'}, status.HTTP_200_OK)
+    assert call(endpoint) == ({'user': 'qwe'}, status.HTTP_200_OK)
+    assert len(session.requests) == 1
+
+
+def test_missing_token_is_forbidden(monkeypatch: pytest.MonkeyPatch):
+    session = SessionMock()
+    mock_session(monkeypatch, session)
+    endpoint = decorate(AuthCheckMock())
+
+    assert call(endpoint, access_token='') == (None, status.HTTP_403_FORBIDDEN)
+    assert session.requests == []
+
+
+def test_auth_disabled_bypasses_auth(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv('AUTH_ENABLED', '0')
+    monkeypatch.delenv('AUTH_ENDPOINT')
+    session = SessionMock()
+    mock_session(monkeypatch, session)
+    auth_check = AuthCheckMock()
+    endpoint = decorate(auth_check)
+
+    assert call(endpoint, access_token='') == ({}, status.HTTP_200_OK)
+    assert session.requests == []
+    assert auth_check.calls == 0
+
+
+def test_env_is_read_when_decorator_is_applied(monkeypatch: pytest.MonkeyPatch):
+    session = SessionMock()
+    mock_session(monkeypatch, session)
+    endpoint = decorate(AuthCheckMock())
+    monkeypatch.setenv('AUTH_ENABLED', '0')
+    monkeypatch.setenv('AUTH_ENDPOINT', 'http://other')
+
+    assert call(endpoint) == ({}, status.HTTP_200_OK)
+    assert session.requests == [('http://auth', {'Authorization': 'token'})]
+
+
+def test_session_is_reused_until_closed():
+
+    async def sessions():
+        first = await decorators._get_session()
+        second = await decorators._get_session()
+        await decorators.close_session()
+        third = await decorators._get_session()
+        await decorators.close_session()
+        return first, second, third
+
+    first, second, third = asyncio.run(sessions())
+    assert first is second
+    assert first.closed
+    assert third is not first
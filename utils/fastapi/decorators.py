@@ -1,15 +1,15 @@
 import aiohttp
-import sys
 import toolbox.config as config
 from cachetools import TTLCache
 from wrapt import decorator
-from typing import Protocol
+from typing import Protocol, Optional
 from collections.abc import Awaitable, Callable, Mapping
 from fastapi import status
 from fastapi.responses import Response as FastAPIResponse
 
 
-__cache = TTLCache(sys.maxsize, ttl=1200)
+__cache = TTLCache(maxsize=10_000, ttl=1200)
+_session: Optional[aiohttp.ClientSession] = None
 
 
 class AuthResponse(Protocol):
@@ -27,7 +27,10 @@ def with_authorization(auth_check: Callable[[AuthResponse], Awaitable]):
 
     To disable authorization set the AUTH_ENABLED env var to 0.
     AUTH_ENDPOINT env var should contain a valid access token validation end point.
+    Both env vars are read once when the decorator is applied.
     """
+    auth_enabled = bool(config.auth_enabled())
+    auth_endpoint = config.auth_endpoint() if auth_enabled else None
 
     @decorator
     async def authorization(
@@ -36,7 +39,7 @@ def with_authorization(auth_check: Callable[[AuthResponse], Awaitable]):
         args,
         kwargs: dict,
     ) -> Awaitable:
-        if not config.auth_enabled():
+        if not auth_enabled:
             return await func(*args, **kwargs)
 
         access_token = kwargs.get('access_token', '')
@@ -44,31 +47,50 @@ def with_authorization(auth_check: Callable[[AuthResponse], Awaitable]):
             __forbid_access(kwargs)
             return
 
-        async def next(response: AuthResponse):
-            auth_resp = await auth_check(response)
-            if auth_resp:
-                if isinstance(auth_resp, Mapping):
-                    kwargs.update(auth_resp)
-                return await func(*args, **kwargs)
-            __forbid_access(kwargs)
-
-        try:
-            response = __cache[access_token]
-            return await next(response)
-        except KeyError:
-            pass
-
-        async with aiohttp.ClientSession() as session:
+        auth_resp = __cache.get(access_token, None)
+        if auth_resp is None:
+            session = await _get_session()
             async with session.get(
-                config.auth_endpoint(),
+                auth_endpoint,
                 headers={'Authorization': access_token},
             ) as response:
-                __cache[access_token] = response
-                return await next(response)
+                auth_resp = await auth_check(response) or False
+            __cache[access_token] = auth_resp
+
+        if auth_resp:
+            if isinstance(auth_resp, Mapping):
+                kwargs.update(auth_resp)
+            return await func(*args, **kwargs)
+        __forbid_access(kwargs)
 
     return authorization
 
 
+async def _get_session() -> aiohttp.ClientSession:
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                ttl_dns_cache=300,
+                keepalive_timeout=60,
+            )
+        )
+    return _session
+
+
+async def close_session():
+    """
+    Closes the pooled auth session.
+    Should be registered as the app shutdown handler:
+    app.add_event_handler('shutdown', close_session)
+    """
+    global _session
+    if _session is not None:
+        await _session.close()
+        _session = None
+
+
 def __forbid_access(kwargs: Mapping):
     resp: FastAPIResponse = kwargs.get('response', None)
     if resp:
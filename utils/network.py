@@ -7,8 +7,8 @@ urllib3.disable_warnings()
 
 def get_data(
     end_point: str,
-    headers={},
-    params={},
+    headers: dict | None = None,
+    params: dict | None = None,
 ) -> str:
     resp = requests.get(
         url=end_point,